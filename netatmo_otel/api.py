@@ -9,6 +9,7 @@ from .config import (
     ENV_REFRESH_TOKEN,
 )
 from .utils import update_env_file
+from .profiler import stage
 
 
 class NetatmoAPI:
@@ -25,10 +26,13 @@ class NetatmoAPI:
                 "client_secret": self.credentials.client_secret,
             }
 
-            response = requests.post(NETATMO_AUTH_URL, data=token_data)
-            response.raise_for_status()
+            # Includes connection and TLS setup
+            with stage("http"):
+                response = requests.post(NETATMO_AUTH_URL, data=token_data)
+                response.raise_for_status()
 
-            tokens = response.json()
+            with stage("json_decode"):
+                tokens = response.json()
             access_token = tokens["access_token"]
             new_refresh_token = tokens["refresh_token"]
 
@@ -46,10 +50,15 @@ class NetatmoAPI:
         try:
             headers = {"Authorization": f"Bearer {access_token}"}
 
-            response = requests.get(NETATMO_STATION_DATA_URL, headers=headers)
-            response.raise_for_status()
+            # Includes connection and TLS setup
+            with stage("http"):
+                response = requests.get(
+                    NETATMO_STATION_DATA_URL, headers=headers
+                )
+                response.raise_for_status()
 
-            return response.json()["body"]
+            with stage("json_decode"):
+                return response.json()["body"]
         except Exception as e:
             print(f"Error retrieving station data: {e}")
             return None
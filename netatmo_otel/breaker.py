@@ -0,0 +1,210 @@
+import copy
+from .config import (
+    BREAKER_STATE_FILE,
+    DEFAULT_MAX_ERRORS,
+    DEFAULT_BREAKER_COOLDOWN,
+    DEFAULT_BREAKER_MAX_COOLDOWN,
+)
+from .utils import load_state, save_state
+
+# Breaker states
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Numeric values used when exporting breaker state as a metric
+STATE_VALUES = {
+    STATE_CLOSED: 0,
+    STATE_HALF_OPEN: 1,
+    STATE_OPEN: 2,
+}
+
+# Endpoints guarded by a breaker
+ENDPOINT_TOKEN = "token"
+ENDPOINT_STATION_DATA = "station_data"
+ENDPOINT_EXPORTER = "exporter"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name,
+        max_errors=DEFAULT_MAX_ERRORS,
+        cooldown=DEFAULT_BREAKER_COOLDOWN,
+        max_cooldown=DEFAULT_BREAKER_MAX_COOLDOWN,
+        state=None,
+    ):
+        self.name = name
+        self.max_errors = max_errors
+        self.cooldown = cooldown  # In collection cycles
+        self.max_cooldown = max_cooldown  # In collection cycles
+
+        state = state or {}
+        self.state = state.get("state", STATE_CLOSED)
+        self.failures = state.get("failures", 0)
+        self.trips = state.get("trips", 0)
+        self.open_cycles = state.get("open_cycles", 0)
+
+    def is_valid(self):
+        """Check if the breaker state is consistent"""
+        counters = [self.failures, self.trips, self.open_cycles]
+        if self.state not in STATE_VALUES:
+            return False
+        if not all(type(value) is int and value >= 0 for value in counters):
+            return False
+
+        # An open breaker must have tripped at least once
+        return self.state == STATE_CLOSED or self.trips > 0
+
+    def current_cooldown(self):
+        """Cycles skipped for the current trip, doubling on each re-open"""
+        if self.trips <= 0:
+            return 0
+        return min(self.cooldown * 2 ** (self.trips - 1), self.max_cooldown)
+
+    def start_cycle(self):
+        """Count a new collection cycle while the breaker is open"""
+        if self.state == STATE_OPEN:
+            self.open_cycles += 1
+
+    def allow_request(self):
+        """Check if a request may be sent, moving to half-open when due"""
+        if self.state == STATE_CLOSED:
+            return True
+
+        if self.state == STATE_OPEN:
+            cooldown = self.current_cooldown()
+            if self.open_cycles <= cooldown:
+                print(
+                    f"Circuit breaker '{self.name}' is open, skipping "
+                    f"request (cycle {self.open_cycles} of {cooldown})"
+                )
+                return False
+            print(f"Circuit breaker '{self.name}' is half-open, probing")
+            self.state = STATE_HALF_OPEN
+
+        return True
+
+    def record_success(self):
+        """Reset the breaker after a successful request"""
+        if self.state != STATE_CLOSED:
+            print(f"Circuit breaker '{self.name}' closed")
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.open_cycles = 0
+
+    def record_failure(self):
+        """Count a failed request, opening the breaker when needed"""
+        self.failures += 1
+        if (
+            self.state == STATE_HALF_OPEN
+            or self.failures >= self.max_errors
+        ):
+            self.trip()
+
+    def trip(self):
+        """Open the breaker and start a new cool-down period
+
+        The cool-down is counted in collection cycles rather than
+        seconds, so that scheduling jitter cannot shorten or extend it.
+        """
+        self.state = STATE_OPEN
+        self.trips += 1
+        self.open_cycles = 0
+        print(
+            f"Circuit breaker '{self.name}' opened after "
+            f"{self.failures} consecutive errors "
+            f"(cool-down: {self.current_cooldown()} cycles)"
+        )
+
+    def to_dict(self):
+        """Get the breaker state for persistence"""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "open_cycles": self.open_cycles,
+        }
+
+
+class BreakerManager:
+    def __init__(self, config_manager, state_file=BREAKER_STATE_FILE):
+        self.config_manager = config_manager
+        self.state_file = state_file
+        self.max_errors = self.config_manager.getint(
+            "General", "max_errors", fallback=DEFAULT_MAX_ERRORS
+        )
+        self.cooldown = self.config_manager.getint(
+            "General",
+            "breaker_cooldown_cycles",
+            fallback=DEFAULT_BREAKER_COOLDOWN,
+        )
+        self.max_cooldown = self.config_manager.getint(
+            "General",
+            "breaker_max_cooldown_cycles",
+            fallback=DEFAULT_BREAKER_MAX_COOLDOWN,
+        )
+        self.breakers = {}
+        self.previous = {}  # Breakers as loaded at the start of the cycle
+
+        # Load previous breaker states if available
+        self.load_state()
+
+    def create(self, name, state=None):
+        """Create a breaker for an endpoint using configured limits"""
+        return CircuitBreaker(
+            name,
+            max_errors=self.max_errors,
+            cooldown=self.cooldown,
+            max_cooldown=self.max_cooldown,
+            state=state,
+        )
+
+    def get(self, name):
+        """Get the breaker for an endpoint, creating it if needed"""
+        if name not in self.breakers:
+            self.breakers[name] = self.create(name)
+        return self.breakers[name]
+
+    def reported_breakers(self):
+        """Get the breakers whose state can be exported this cycle
+
+        The exporter breaker is only updated once metrics have been
+        flushed, so its state from the previous cycle is reported.
+        """
+        reported = dict(self.breakers)
+        if ENDPOINT_EXPORTER in reported:
+            reported[ENDPOINT_EXPORTER] = self.previous.get(
+                ENDPOINT_EXPORTER, self.create(ENDPOINT_EXPORTER)
+            )
+        return reported
+
+    def load_state(self):
+        """Load breaker states from state file, starting a new cycle"""
+        states = load_state(self.state_file)
+        if not isinstance(states, dict):
+            print(f"Ignoring invalid breaker state in {self.state_file}")
+            states = {}
+
+        for name, state in states.items():
+            breaker = self.create(
+                name, state if isinstance(state, dict) else None
+            )
+            if not isinstance(state, dict) or not breaker.is_valid():
+                print(f"Ignoring invalid state for circuit breaker '{name}'")
+                breaker = self.create(name)
+
+            self.previous[name] = copy.copy(breaker)
+            breaker.start_cycle()
+            self.breakers[name] = breaker
+
+    def save_state(self):
+        """Save breaker states to state file"""
+        save_state(
+            self.state_file,
+            {
+                name: breaker.to_dict()
+                for name, breaker in self.breakers.items()
+            },
+        )
@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 DEFAULT_ENV_FILE = ".env"
 DEFAULT_CONFIG_FILE = "netatmo_config.ini"
 STATE_FILE = "netatmo_state.json"
+BREAKER_STATE_FILE = "netatmo_breaker.json"
+DEFAULT_PROFILE_DIR = "profiles"
 
 # API endpoints
 NETATMO_AUTH_URL = "https://api.netatmo.com/oauth2/token"
@@ -25,6 +27,8 @@ ENV_REDIRECT_URI = "NETATMO_REDIRECT_URI"
 # Default settings
 DEFAULT_POLL_INTERVAL = 300  # 5 minutes in seconds
 DEFAULT_MAX_ERRORS = 5
+DEFAULT_BREAKER_COOLDOWN = 1  # Collection cycles skipped on first trip
+DEFAULT_BREAKER_MAX_COOLDOWN = 12  # 1 hour at the default poll interval
 DEFAULT_REDIRECT_URI = "http://localhost"
 
 # OpenTelemetry defaults
@@ -55,6 +59,10 @@ class ConfigManager:
             self.config["General"] = {
                 "poll_interval_seconds": str(DEFAULT_POLL_INTERVAL),
                 "max_errors": str(DEFAULT_MAX_ERRORS),
+                "breaker_cooldown_cycles": str(DEFAULT_BREAKER_COOLDOWN),
+                "breaker_max_cooldown_cycles": str(
+                    DEFAULT_BREAKER_MAX_COOLDOWN
+                ),
             }
             self.config["OpenTelemetry"] = {
                 "enabled": str(DEFAULT_OTEL_ENABLED).lower(),
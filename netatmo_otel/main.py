@@ -1,15 +1,24 @@
 import os
 import sys
+import argparse
 from .config import (
     ConfigManager,
     ENV_CLIENT_ID,
     ENV_CLIENT_SECRET,
     ENV_REFRESH_TOKEN,
     DEFAULT_REDIRECT_URI,
+    DEFAULT_PROFILE_DIR,
 )
 from .models import Credentials
 from .api import NetatmoAPI
 from .telemetry import TelemetryManager
+from .breaker import (
+    BreakerManager,
+    ENDPOINT_TOKEN,
+    ENDPOINT_STATION_DATA,
+    ENDPOINT_EXPORTER,
+)
+from .profiler import CycleProfiler, stage
 
 
 def display_readings(readings):
@@ -44,29 +53,44 @@ def display_readings(readings):
         print("")  # Add a blank line
 
 
-def get_and_send_weather_data(api, telemetry):
+def get_and_send_weather_data(api, telemetry, breakers):
     """Get weather data from Netatmo API and send to OpenTelemetry"""
     try:
         # Get access token
-        access_token = api.refresh_access_token()
+        token_breaker = breakers.get(ENDPOINT_TOKEN)
+        if not token_breaker.allow_request():
+            return False
+        with stage("token_refresh"):
+            access_token = api.refresh_access_token()
         if not access_token:
+            token_breaker.record_failure()
             return False
+        token_breaker.record_success()
 
         # Get station data
-        station_data = api.get_station_data(access_token)
+        station_breaker = breakers.get(ENDPOINT_STATION_DATA)
+        if not station_breaker.allow_request():
+            return False
+        with stage("station_data"):
+            station_data = api.get_station_data(access_token)
         if not station_data:
+            station_breaker.record_failure()
             return False
+        station_breaker.record_success()
 
         # Parse weather readings
-        readings = api.parse_weather_readings(station_data)
+        with stage("parse_weather_readings"):
+            readings = api.parse_weather_readings(station_data)
 
         # Display readings
-        display_readings(readings)
+        with stage("display_readings"):
+            display_readings(readings)
 
-        # Send metrics to OpenTelemetry
+        # Record metrics for OpenTelemetry
         if readings:
-            for reading in readings:
-                telemetry.record_metrics(reading)
+            with stage("record_metrics"):
+                for reading in readings:
+                    telemetry.record_metrics(reading)
 
         return True
 
@@ -75,8 +99,78 @@ def get_and_send_weather_data(api, telemetry):
         return False
 
 
-def main():
+def export_metrics(telemetry, breakers, send=True):
+    """Send recorded metrics to OpenTelemetry unless the collector is down"""
+    if send:
+        exporter_breaker = breakers.get(ENDPOINT_EXPORTER)
+        telemetry.record_breaker_metrics(breakers)
+
+        exported = telemetry.flush()
+        if exported is False:
+            exporter_breaker.record_failure()
+        elif exported:
+            exporter_breaker.record_success()
+
+    # Metrics were flushed above, do not export them again on exit
+    telemetry.shutdown()
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Get Netatmo weather data and send it to OpenTelemetry"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each stage of the cycle and write a profile report",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help=f"directory for profile reports (default: {DEFAULT_PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--profile-cprofile",
+        action="store_true",
+        help="also capture cProfile function statistics",
+    )
+    parser.add_argument(
+        "--profile-tracemalloc",
+        action="store_true",
+        help="also capture memory allocations with tracemalloc",
+    )
+    return parser.parse_args(argv)
+
+
+def run_cycle(config_manager, api):
+    """Run one collection cycle, from telemetry setup to breaker state"""
+    # Load circuit breakers, starting a new cycle for their cool-downs
+    with stage("breaker_state"):
+        breakers = BreakerManager(config_manager)
+
+    # Setup telemetry
+    with stage("telemetry_setup"):
+        telemetry = TelemetryManager(config_manager)
+
+    # Get weather data just once, unless it could not be exported
+    send = breakers.get(ENDPOINT_EXPORTER).allow_request()
+    if send:
+        success = get_and_send_weather_data(api, telemetry, breakers)
+    else:
+        success = False
+
+    # Send metrics and save circuit breaker state
+    with stage("export"):
+        export_metrics(telemetry, breakers, send)
+    with stage("breaker_state"):
+        breakers.save_state()
+    return success
+
+
+def main(argv=None):
     """Main function to get and send weather data once"""
+    args = parse_args(argv)
 
     # Load configuration
     config_manager = ConfigManager()
@@ -108,12 +202,20 @@ def main():
             print("Failed to set up initial authorization. Exiting.")
             return False
 
-    # Setup telemetry
-    telemetry = TelemetryManager(config_manager)
+    if not args.profile:
+        return run_cycle(config_manager, api)
 
-    # Get and send weather data just once
-    success = get_and_send_weather_data(api, telemetry)
-    return success
+    # Profile the collection cycle
+    profiler = CycleProfiler(
+        args.profile_dir,
+        use_cprofile=args.profile_cprofile,
+        use_tracemalloc=args.profile_tracemalloc,
+    )
+    profiler.start()
+    try:
+        return run_cycle(config_manager, api)
+    finally:
+        profiler.stop()
 
 
 if __name__ == "__main__":
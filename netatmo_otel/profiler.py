@@ -0,0 +1,210 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from .config import DEFAULT_PROFILE_DIR
+
+# Number of functions listed in the JSON report when cProfile is enabled
+TOP_FUNCTIONS = 25
+
+# Profiler of the running collection cycle, if any
+_active_profiler = None
+
+
+@contextmanager
+def stage(name):
+    """Time a stage of the collection cycle when profiling is active"""
+    if _active_profiler is None:
+        yield
+    else:
+        with _active_profiler.stage(name):
+            yield
+
+
+def profiled(name):
+    """Decorator timing each call of a function as a stage"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class CycleProfiler:
+    def __init__(
+        self,
+        output_dir=DEFAULT_PROFILE_DIR,
+        use_cprofile=False,
+        use_tracemalloc=False,
+    ):
+        self.output_dir = output_dir
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+        self.cprofile = None
+        self.started_at = None
+        self.memory_peak = None
+        self.stages = {}  # Aggregated timings by stage path
+        self.stack = []  # Stages currently running
+
+    def start(self):
+        """Start profiling a collection cycle"""
+        global _active_profiler
+
+        self.started_at = datetime.now()
+        if self.use_tracemalloc:
+            tracemalloc.start()
+        if self.use_cprofile:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+        self.enter_stage("cycle")
+        _active_profiler = self
+
+    def stop(self):
+        """Stop profiling and write the cycle report"""
+        global _active_profiler
+
+        _active_profiler = None
+        self.exit_stage()
+
+        if self.cprofile:
+            self.cprofile.disable()
+        if self.use_tracemalloc:
+            self.memory_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        return self.write_report()
+
+    @contextmanager
+    def stage(self, name):
+        """Time a named stage nested in the currently running one"""
+        self.enter_stage(name)
+        try:
+            yield
+        finally:
+            self.exit_stage()
+
+    def enter_stage(self, name):
+        """Push a stage onto the stack of running stages"""
+        if self.stack:
+            path = f"{self.stack[-1]['path']};{name}"
+        else:
+            path = name
+
+        self.stack.append(
+            {
+                "path": path,
+                "start": time.perf_counter(),
+                "children": 0.0,
+                "memory": self.traced_memory(),
+            }
+        )
+
+    def exit_stage(self):
+        """Pop the innermost running stage and record its timing"""
+        frame = self.stack.pop()
+        elapsed = time.perf_counter() - frame["start"]
+        if self.stack:
+            self.stack[-1]["children"] += elapsed
+
+        stats = self.stages.setdefault(
+            frame["path"],
+            {"calls": 0, "total_seconds": 0.0, "self_seconds": 0.0},
+        )
+        stats["calls"] += 1
+        stats["total_seconds"] += elapsed
+        stats["self_seconds"] += elapsed - frame["children"]
+
+        if frame["memory"] is not None:
+            stats["memory_delta_bytes"] = (
+                stats.get("memory_delta_bytes", 0)
+                + self.traced_memory()
+                - frame["memory"]
+            )
+
+    def traced_memory(self):
+        """Get currently traced memory, None when tracemalloc is off"""
+        if not self.use_tracemalloc:
+            return None
+        return tracemalloc.get_traced_memory()[0]
+
+    def top_functions(self):
+        """Get the functions with the highest cumulative time"""
+        stats = pstats.Stats(self.cprofile).stats
+        ranked = sorted(
+            stats.items(), key=lambda item: item[1][3], reverse=True
+        )
+
+        functions = []
+        for (filename, line, name), timings in ranked[:TOP_FUNCTIONS]:
+            _, calls, tottime, cumtime, _ = timings
+            functions.append(
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "calls": calls,
+                    "self_seconds": round(tottime, 6),
+                    "cumulative_seconds": round(cumtime, 6),
+                }
+            )
+        return functions
+
+    def write_report(self):
+        """Write collapsed stacks and a JSON stage breakdown
+
+        The collapsed stack file holds one "stage;substage microseconds"
+        line per stage using self time, as expected by flamegraph tools.
+        Returns the base path of the written files, or None on error.
+        """
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            base_path = os.path.join(
+                self.output_dir,
+                f"cycle-{self.started_at.strftime('%Y%m%d-%H%M%S-%f')}",
+            )
+
+            with open(f"{base_path}.collapsed", "w") as f:
+                for path, stats in self.stages.items():
+                    microseconds = round(stats["self_seconds"] * 1e6)
+                    if microseconds > 0:
+                        f.write(f"{path} {microseconds}\n")
+
+            stages = []
+            for path, stats in self.stages.items():
+                entry = {"stage": path}
+                for key, value in stats.items():
+                    if isinstance(value, float):
+                        value = round(value, 6)
+                    entry[key] = value
+                stages.append(entry)
+
+            report = {
+                "started_at": self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+                "duration_seconds": round(
+                    self.stages["cycle"]["total_seconds"], 6
+                ),
+                "stages": stages,
+            }
+            if self.memory_peak is not None:
+                report["memory_peak_bytes"] = self.memory_peak
+            if self.cprofile:
+                self.cprofile.dump_stats(f"{base_path}.prof")
+                report["top_functions"] = self.top_functions()
+
+            with open(f"{base_path}.json", "w") as f:
+                json.dump(report, f, indent=2)
+
+            print(f"Profile report written to: {base_path}.*")
+            return base_path
+        except Exception as e:
+            print(f"Error writing profile report: {e}")
+            return None
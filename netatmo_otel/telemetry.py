@@ -3,7 +3,10 @@ from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
     OTLPMetricExporter,
 )
 from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.export import (
+    MetricExportResult,
+    PeriodicExportingMetricReader,
+)
 from opentelemetry.sdk.resources import Resource
 
 from .config import (
@@ -14,9 +17,31 @@ from .config import (
     DEFAULT_OTEL_COLLECTOR_ENDPOINT,
     STATE_FILE,
 )
+from .breaker import STATE_VALUES
 from .utils import load_state, save_state
 
 
+class TrackingMetricExporter(OTLPMetricExporter):
+    """OTLP exporter remembering the result of its last export"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_result = None
+        self.paused = False
+
+    def export(self, metrics_data, *args, **kwargs):
+        # Skip exports once metrics have been flushed explicitly
+        if self.paused:
+            return MetricExportResult.SUCCESS
+
+        try:
+            self.last_result = super().export(metrics_data, *args, **kwargs)
+        except Exception:
+            self.last_result = MetricExportResult.FAILURE
+            raise
+        return self.last_result
+
+
 class TelemetryManager:
     def __init__(self, config_manager):
         self.config_manager = config_manager
@@ -24,7 +49,10 @@ class TelemetryManager:
             "OpenTelemetry", "enabled", fallback=DEFAULT_OTEL_ENABLED
         )
         self.meter = None
+        self.provider = None
+        self.exporter = None
         self.gauges = {}
+        self.breaker_gauges = {}
         self.previous_values = {}
 
         # Define unit mappings
@@ -81,14 +109,14 @@ class TelemetryManager:
 
             # Set up OTLP gRPC exporter to send to collector
             # Note that the OTLPMetricExporter uses gRPC by default
-            exporter = OTLPMetricExporter(
+            self.exporter = TrackingMetricExporter(
                 endpoint=collector_endpoint,
                 insecure=True,  # For development; set to False
                                 # and use credentials in production
             )
 
             reader = PeriodicExportingMetricReader(
-                exporter,
+                self.exporter,
                 export_interval_millis=DEFAULT_OTEL_EXPORT_INTERVAL_MS,
             )
 
@@ -98,10 +126,13 @@ class TelemetryManager:
             )
 
             # Create meter provider
-            provider = MeterProvider(
-                metric_readers=[reader], resource=resource
+            # Shut down explicitly so no export runs at exit
+            self.provider = MeterProvider(
+                metric_readers=[reader],
+                resource=resource,
+                shutdown_on_exit=False,
             )
-            metrics.set_meter_provider(provider)
+            metrics.set_meter_provider(self.provider)
 
             # Create meter
             self.meter = metrics.get_meter(namespace)
@@ -116,6 +147,27 @@ class TelemetryManager:
                     unit=self.metric_units.get(metric_key, ""),
                 )
 
+            # Initialize circuit breaker gauges
+            # The exporter breaker is reported as of the previous cycle
+            self.breaker_gauges["state"] = self.meter.create_gauge(
+                name="netatmo.breaker.state",
+                description=(
+                    "Circuit breaker state "
+                    "(0 = closed, 1 = half-open, 2 = open)"
+                ),
+            )
+            self.breaker_gauges["failures"] = self.meter.create_gauge(
+                name="netatmo.breaker.failures",
+                description="Consecutive errors seen by the circuit breaker",
+            )
+            self.breaker_gauges["cooldown"] = self.meter.create_gauge(
+                name="netatmo.breaker.cooldown",
+                description=(
+                    "Current circuit breaker cool-down in collection cycles"
+                ),
+                unit="{cycle}",
+            )
+
             print(
                 f"OpenTelemetry configured to send metrics via gRPC "
                 f"to collector at: {collector_endpoint}"
@@ -175,6 +227,63 @@ class TelemetryManager:
         except Exception as e:
             print(f"Error recording telemetry: {e}")
 
+    def record_breaker_metrics(self, breaker_manager):
+        """Record the state of each circuit breaker using gauges
+
+        Metrics are recorded before they are flushed, so the exporter
+        breaker is reported with its state from the previous cycle.
+        """
+        if not self.enabled or not self.meter:
+            return
+
+        try:
+            reported = breaker_manager.reported_breakers()
+            for name, breaker in reported.items():
+                attributes = {"endpoint": name}
+                self.breaker_gauges["state"].set(
+                    STATE_VALUES[breaker.state], attributes
+                )
+                self.breaker_gauges["failures"].set(
+                    breaker.failures, attributes
+                )
+                self.breaker_gauges["cooldown"].set(
+                    breaker.current_cooldown(), attributes
+                )
+        except Exception as e:
+            print(f"Error recording breaker telemetry: {e}")
+
+    def flush(self):
+        """Export pending metrics now and report whether export succeeded
+
+        Returns None when telemetry is disabled.
+        """
+        if not self.enabled or not self.provider:
+            return None
+
+        try:
+            self.exporter.last_result = None
+            self.provider.force_flush()
+        except Exception as e:
+            print(f"Error flushing telemetry: {e}")
+            return False
+
+        return self.exporter.last_result == MetricExportResult.SUCCESS
+
+    def shutdown(self):
+        """Shut down telemetry without exporting metrics again
+
+        Metrics are exported with flush(), so the last collection run by
+        the reader on shutdown must not reach the collector.
+        """
+        if not self.provider:
+            return
+
+        try:
+            self.exporter.paused = True
+            self.provider.shutdown()
+        except Exception as e:
+            print(f"Error shutting down telemetry: {e}")
+
     def load_state(self):
         """Load previous metric values from state file"""
         self.previous_values = load_state(STATE_FILE)
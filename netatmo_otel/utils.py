@@ -1,8 +1,10 @@
 import os
 import json
 from .config import DEFAULT_ENV_FILE
+from .profiler import profiled
 
 
+@profiled("env_update")
 def update_env_file(key, value, env_file=DEFAULT_ENV_FILE):
     """Update a specific key in the .env file with a new value"""
     try:
@@ -33,6 +35,7 @@ def update_env_file(key, value, env_file=DEFAULT_ENV_FILE):
         print(f"Warning: Could not update {key} in {env_file} file: {e}")
 
 
+@profiled("state_save")
 def save_state(filename, state):
     """Save state to a JSON file"""
     try:
@@ -42,6 +45,7 @@ def save_state(filename, state):
         print(f"Error saving state: {e}")
 
 
+@profiled("state_load")
 def load_state(filename):
     """Load state from a JSON file"""
     if not os.path.exists(filename):